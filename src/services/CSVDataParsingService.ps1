@@ -443,7 +443,7 @@ class CSVDataParsingService {
     try {
       # Handle boolean fields
       if ($fieldName -in @("stateful", "tcp_strict", "locked", "disabled", "log")) {
-        return $value.ToLower() -eq "true"
+        return $value -eq "true"
       }
 
       # Handle numeric fields
@@ -77,18 +77,11 @@ class ConfigurationService {
             }
 
             $jsonContent = Get-Content -Path $configFile -Raw | ConvertFrom-Json
-            $config = [PSCustomObject]@{}
 
-            # Convert PSCustomObject to PSCustomObject with proper property access
-            $jsonContent.PSObject.Properties | ForEach-Object {
-                $config | Add-Member -NotePropertyName $_.Name -NotePropertyValue $_.Value -Force
-            }
-
-            # Merge with defaults to ensure all keys exist - replace hash table iteration with PSCustomObject properties
+            # Merge with defaults in a single pass over the parsed properties - no intermediate copy
             $mergedConfig = $this.defaultConfig.Clone()
-            $configProperties = ($config | Get-Member -MemberType NoteProperty).Name
-            foreach ($key in $configProperties) {
-                $mergedConfig | Add-Member -NotePropertyName $key -NotePropertyValue $config.$key -Force
+            foreach ($property in $jsonContent.PSObject.Properties) {
+                $mergedConfig | Add-Member -NotePropertyName $property.Name -NotePropertyValue $property.Value -Force
             }
 
             # Cache the configuration - replace hash table assignment with PSCustomObject property addition
@@ -113,7 +106,39 @@ class ConfigurationService {
                 $this.logger.LogInfo("Saving configuration to: $configFile", "Configuration")
             }
 
-            $config | ConvertTo-Json -Depth 10 -Compress | Out-File -FilePath $configFile -Encoding UTF8 -Force
+            $jsonContent = $config | ConvertTo-Json -Depth 10 -Compress
+            $resolvedConfigFile = $ExecutionContext.SessionState.Path.GetUnresolvedProviderPathFromPSPath($configFile)
+
+            # Identical content already on disk - skip the rewrite so file watchers are not triggered
+            $existingContent = $null
+            if ([System.IO.File]::Exists($resolvedConfigFile)) {
+                $existingContent = [System.IO.File]::ReadAllText($resolvedConfigFile)
+            }
+            if ($null -ne $existingContent -and $existingContent.TrimEnd() -ceq $jsonContent) {
+                if ($this.logger) {
+                    $this.logger.LogDebug("Configuration unchanged, skipping write: $configFile", "Configuration")
+                }
+            }
+            else {
+                # Write to a sibling temp file and swap it in so an interrupted save never leaves a truncated config
+                $tempFile = "$resolvedConfigFile.tmp"
+                try {
+                    $jsonContent | Out-File -LiteralPath $tempFile -Encoding UTF8 -Force
+                    if ([System.IO.File]::Exists($resolvedConfigFile)) {
+                        # File.Replace swaps in one step - Move-Item -Force deletes the target first
+                        [System.IO.File]::Replace($tempFile, $resolvedConfigFile, [NullString]::Value)
+                    }
+                    else {
+                        [System.IO.File]::Move($tempFile, $resolvedConfigFile)
+                    }
+                }
+                catch {
+                    if ([System.IO.File]::Exists($tempFile)) {
+                        [System.IO.File]::Delete($tempFile)
+                    }
+                    throw
+                }
+            }
 
             # Update cache - replace hash table assignment with PSCustomObject property addition
             $this.configCache | Add-Member -NotePropertyName $configName -NotePropertyValue $config.Clone() -Force
@@ -174,8 +199,17 @@ class ConfigurationService {
     # List available configurations
     [string[]] ListConfigurations() {
         try {
-            $configFiles = Get-ChildItem -Path $this.configurationPath -Filter "*.json" -ErrorAction SilentlyContinue
-            return $configFiles | ForEach-Object { $_.BaseName }
+            # Enumerate names directly - no FileInfo objects or pipeline needed just to read base names
+            $configDirectory = $ExecutionContext.SessionState.Path.GetUnresolvedProviderPathFromPSPath($this.configurationPath)
+            if (-not [System.IO.Directory]::Exists($configDirectory)) {
+                return @()
+            }
+
+            $configNames = [System.Collections.Generic.List[string]]::new()
+            foreach ($configFile in [System.IO.Directory]::EnumerateFiles($configDirectory, "*.json")) {
+                $configNames.Add([System.IO.Path]::GetFileNameWithoutExtension($configFile))
+            }
+            return $configNames.ToArray()
         }
         catch {
             if ($this.logger) {
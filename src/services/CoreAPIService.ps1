@@ -7,6 +7,9 @@ class CoreAPIService {
     hidden [object] $authService
     hidden [object] $configService
     hidden [object] $endpointCache
+    hidden [object] $domainsCache = [PSCustomObject]@{}
+    hidden [bool] $domainsFallbackUsed = $false
+    hidden static [int] $domainsCacheTTLMinutes = 10
 
     # Constructor with dependency injection
     CoreAPIService([object] $loggingService, [object] $authService, [object] $configService) {
@@ -52,6 +55,51 @@ class CoreAPIService {
     }
 
 
+    # Domains probed once per manager and reused until the TTL lapses - every endpoint lookup needs them
+    hidden [object] GetCachedDomains([string] $nsxManager) {
+        if ((Get-Member -InputObject $this.domainsCache -Name $nsxManager -MemberType NoteProperty -ErrorAction SilentlyContinue)) {
+            $cacheEntry = $this.domainsCache.$nsxManager
+            if ((Get-Date) -lt $cacheEntry.expiry) {
+                return $cacheEntry.domains
+            }
+        }
+
+        $this.domainsFallbackUsed = $false
+        $domains = $this.GetDomains($nsxManager)
+
+        # Every probe failed - do not pin routing to the synthesized default, probe again on the next call
+        if ($this.domainsFallbackUsed) {
+            return $domains
+        }
+
+        $cacheEntry = [PSCustomObject]@{
+            domains = $domains
+            expiry  = (Get-Date).AddMinutes([CoreAPIService]::domainsCacheTTLMinutes)
+        }
+        $this.domainsCache | Add-Member -NotePropertyName $nsxManager -NotePropertyValue $cacheEntry -Force
+        return $domains
+    }
+
+    # Get domains from a manager - implemented by the derived API services
+    [object] GetDomains([string] $nsxManager) {
+        throw "GetDomains is not implemented by $($this.GetType().Name)"
+    }
+
+    # Default domain response used when every domain probe fails - flagged so it is never cached
+    hidden [object] NewDefaultDomains() {
+        $this.domainsFallbackUsed = $true
+        return [PSCustomObject]@{
+            results      = @(
+                @{
+                    id            = "default"
+                    display_name  = "default"
+                    resource_type = "Domain"
+                }
+            )
+            result_count = 1
+        }
+    }
+
     # Generic REST method following Open/Closed Principle
     [object] InvokeRestMethod([string] $nsxManager, [PSCredential] $credential, [string] $endpoint, [string] $method = 'GET', [object] $body = $null, [object] $additionalHeaders = [PSCustomObject]@{}) {
 
@@ -290,7 +338,8 @@ class CoreAPIService {
 
     # Get paginated results (following DRY principle)
     [array] GetPaginatedResults([string] $nsxManager, [PSCredential] $credential, [string] $endpoint, [int] $pageSize = 100) {
-        $allResults = @()
+        # Accumulate pages in a list - array += copies every prior page on each append
+        $allResults = [System.Collections.Generic.List[object]]::new()
         $cursor = $null
 
         do {
@@ -306,7 +355,7 @@ class CoreAPIService {
                 $result = $this.InvokeRestMethod($nsxManager, $credential, $uri, "GET")
 
                 if ($result.results) {
-                    $allResults += $result.results
+                    $allResults.AddRange([object[]]@($result.results))
                 }
 
                 $cursor = $result.cursor
@@ -317,7 +366,7 @@ class CoreAPIService {
             }
         } while ($cursor)
 
-        return $allResults
+        return $allResults.ToArray()
     }
 
     # Clear endpoint cache
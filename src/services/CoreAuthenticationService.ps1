@@ -8,6 +8,9 @@ class CoreAuthenticationService {
     hidden [object] $configurationService
     hidden [object] $certificateCallbacks = [PSCustomObject]@{}
 
+    # Invoke-RestMethod capability probe result, shared across instances for the session
+    hidden static [object] $skipCertificateCheckSupported = $null
+
     # Constructor with dependency injection
     CoreAuthenticationService([object] $loggingService, [object] $credentialService, [object] $configurationService) {
         $this.logger = $loggingService
@@ -235,10 +238,13 @@ class CoreAuthenticationService {
                 try {
                     # Check PowerShell version and apply appropriate SSL bypass
                     if ($global:PSVersionTable.PSVersion.Major -ge 6) {
-                        # PowerShell 6+ supports SkipCertificateCheck parameter
-                        $command = Get-Command Invoke-RestMethod
-                        # CANONICAL FIX: Replace ContainsKey with PSCustomObject property access pattern
-                        if ((Get-Member -InputObject $command.Parameters -Name 'SkipCertificateCheck' -MemberType NoteProperty -ErrorAction SilentlyContinue)) {
+                        # PowerShell 6+ supports SkipCertificateCheck parameter - probe the cmdlet once per session
+                        if ($null -eq [CoreAuthenticationService]::skipCertificateCheckSupported) {
+                            $command = Get-Command Invoke-RestMethod
+                            # CANONICAL FIX: Replace ContainsKey with PSCustomObject property access pattern
+                            [CoreAuthenticationService]::skipCertificateCheckSupported = [bool](Get-Member -InputObject $command.Parameters -Name 'SkipCertificateCheck' -MemberType NoteProperty -ErrorAction SilentlyContinue)
+                        }
+                        if ([CoreAuthenticationService]::skipCertificateCheckSupported) {
                             $restParams.SkipCertificateCheck = $true
                             $this.logger.LogDebug("Added SkipCertificateCheck parameter for PowerShell 6+", "Authentication")
                         }
@@ -15,6 +15,7 @@ class DataObjectFilterService {
   hidden [object] $propertyInclusionsConfig
   hidden [object] $propertyExclusionsConfig
   hidden [object] $multiStepFilteringConfig
+  hidden [object] $sortedStepDefinitions
 
   # Default parameterless constructor
   DataObjectFilterService() {
@@ -170,6 +171,7 @@ class DataObjectFilterService {
     }
 
     # Load multi-step filtering configuration
+    $this.sortedStepDefinitions = $null
     try {
       if (Test-Path $this.multiStepFilteringConfigPath) {
         $jsonContent = Get-Content -Path $this.multiStepFilteringConfigPath -Raw | ConvertFrom-Json
@@ -1239,8 +1241,11 @@ class DataObjectFilterService {
     $filteredObject = $objectToFilter.Clone()
     $stepDefinitions = $this.multiStepFilteringConfig.multi_step_filtering.step_definitions
 
-    # Sort steps by step_order
-    $sortedSteps = $stepDefinitions | Sort-Object { $_.step_order }
+    # Sort steps by step_order once - the definitions do not change between nesting levels.
+    if ($null -eq $this.sortedStepDefinitions) {
+      $this.sortedStepDefinitions = @($stepDefinitions | Sort-Object { $_.step_order })
+    }
+    $sortedSteps = $this.sortedStepDefinitions
 
     if ($this.logger) {
       $this.logger.LogDebug("Processing multi-step filtering at level $currentLevel with $(($sortedSteps).Count) steps", "DataObjectFilter")
@@ -1298,6 +1303,11 @@ class DataObjectFilterService {
       return @()
     }
 
+    # A single object gains nothing from the runspace pool - skip its setup and teardown
+    if ($objectsToFilter.Count -eq 1) {
+      return $this.FilterObjectsArrayWithPropertyFilteringSerial($objectsToFilter)
+    }
+
     if ($this.logger) {
       $this.logger.LogInfo("Starting parallel property-level filtering for $(($objectsToFilter).Count) objects", "DataObjectFilter")
     }
@@ -9,7 +9,7 @@
 # Examples:
 #   - tools/NSXConfigSync.ps1 -> tools/logs/NSXConfigSync.log
 #   - src/utilities/script.ps1 -> src/utilities/logs/script.log
-# The LoggingService always ensures the log directory exists before writing any files.
+# The LoggingService creates the log directory on the first file write, before any file is written.
 # This is a non-negotiable standard for all NSX Toolkit services and scripts.
 class LoggingService {
     hidden [string] $logDirectory
@@ -17,11 +17,10 @@ class LoggingService {
     hidden [bool] $fileOutput
     hidden [string] $logLevel
     hidden [object] $logLevels
+    hidden [bool] $logDirectoryReady = $false
 
     # Constructor with dependency injection
     LoggingService([string] $logDir = $null, [bool] $console = $true, [bool] $file = $true) {
-        # CANONICAL PATTERN: Always ensure log directory exists before writing
-        # This logic is mandatory and must not be removed or bypassed.
         $this.logLevels = @{
             'DEBUG'    = 0
             'INFO'     = 1
@@ -39,19 +38,36 @@ class LoggingService {
             $this.logDirectory = $logDir
         }
         else {
-            # Detect calling script's directory and create logs subdirectory
+            # Detect calling script's logs subdirectory - created by EnsureLogDirectory on first write
             $this.logDirectory = $this.GetCallingScriptLogDirectory()
         }
+    }
+
+    # CANONICAL PATTERN: Always ensure log directory exists before writing
+    # Creation is deferred to the first file write so unused loggers never touch the disk.
+    # This logic is mandatory and must not be removed or bypassed.
+    hidden [void] EnsureLogDirectory() {
+        if ($this.logDirectoryReady) {
+            return
+        }
 
-        # Ensure log directory exists
-        if ($this.fileOutput -and -not (Test-Path $this.logDirectory)) {
+        if (-not (Test-Path $this.logDirectory)) {
             New-Item -Path $this.logDirectory -ItemType Directory -Force | Out-Null
         }
+        $this.logDirectoryReady = $true
+    }
+
+    # Check whether messages at the given level pass the configured threshold and have somewhere to go
+    hidden [bool] IsLevelEnabled([string] $level) {
+        if (-not $this.consoleOutput -and -not $this.fileOutput) {
+            return $false
+        }
+        return $this.logLevels[$level] -ge $this.logLevels[$this.logLevel]
     }
 
     # Core logging method following Open/Closed Principle
     hidden [void] WriteLog([string] $level, [string] $message, [string] $category = "General") {
-        if ($this.logLevels[$level] -lt $this.logLevels[$this.logLevel]) {
+        if (-not $this.IsLevelEnabled($level)) {
             return
         }
 
@@ -65,6 +81,7 @@ class LoggingService {
 
         # File output
         if ($this.fileOutput) {
+            $this.EnsureLogDirectory()
             $logFile = Join-Path $this.logDirectory $this.GetLogFileName()
             $formattedMessage | Out-File -FilePath $logFile -Append -Encoding UTF8
         }
@@ -129,6 +146,11 @@ class LoggingService {
 
     # API-specific logging methods for debugging
     [void] LogAPIRequest([string] $method, [string] $uri, [object] $headers = $null, [object] $body = $null) {
+        # Skip JSON serialisation of headers and body when DEBUG output is filtered out
+        if (-not $this.IsLevelEnabled('DEBUG')) {
+            return
+        }
+
         $this.WriteLog('DEBUG', "API REQUEST: $method $uri", "API")
 
         if ($headers) {
@@ -137,12 +159,17 @@ class LoggingService {
         }
 
         if ($body) {
-            $bodyContent = if ($body -is [string]) { $body } else { $body | ConvertTo-Json -Depth 10 }
+            $bodyContent = if ($body -is [string]) { $body } else { $body | ConvertTo-Json -Depth 10 -Compress }
             $this.WriteLog('DEBUG', "API REQUEST BODY: $bodyContent", "API")
         }
     }
 
     [void] LogAPIResponse([string] $method, [string] $uri, [int] $statusCode, [object] $response = $null, [long] $durationMs = 0) {
+        # Skip JSON serialisation of the response when DEBUG output is filtered out
+        if (-not $this.IsLevelEnabled('DEBUG')) {
+            return
+        }
+
         $this.WriteLog('DEBUG', "API RESPONSE: $method $uri - Status: $statusCode - Duration: ${durationMs}ms", "API")
 
         if ($response) {
@@ -266,12 +293,22 @@ class LoggingService {
             $configPath = Join-Path $rootPath "config\nsx-config.json"
 
             if (Test-Path $configPath) {
-                $config = Get-Content -Path $configPath -Raw | ConvertFrom-Json
+                $resolvedLevel = 'INFO'
+                # Reuse the parsed nsx-config.json while it is unchanged - LoggingService can load before SharedToolUtilityService
+                $sharedUtilityType = ([System.Management.Automation.PSTypeName]'SharedToolUtilityService').Type
+                $config = if ($sharedUtilityType) {
+                    $sharedUtilityType::ReadJsonFileCached($configPath)
+                }
+                else {
+                    Get-Content -Path $configPath -Raw | ConvertFrom-Json
+                }
                 # CANONICAL FIX: Replace ContainsKey with PSCustomObject property access pattern
                 if ($config.logLevel -and ((Get-Member -InputObject $this.logLevels -Name $config.logLevel.ToUpper() -MemberType NoteProperty -ErrorAction SilentlyContinue))) {
                     Write-Host "[$((Get-Date).ToString('yyyy-MM-dd HH:mm:ss'))] [INFO] [LoggingService] Log level set to: $($config.logLevel.ToUpper()) from nsx-config.json" -ForegroundColor Green
-                    return $config.logLevel.ToUpper()
+                    $resolvedLevel = $config.logLevel.ToUpper()
                 }
+
+                return $resolvedLevel
             }
         }
         catch {
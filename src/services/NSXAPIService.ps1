@@ -5,6 +5,26 @@
 class NSXAPIService : CoreAPIService {
     [string]$NSXManager
 
+    # Endpoint route templates (federated or local) by resource type - built once, {domainId} substituted per call
+    hidden static [object] $endpointTemplates = [PSCustomObject]@{
+        federated = [PSCustomObject]@{
+            "services"          = @("global-manager/api/v1", "global-infra/services")
+            "groups"            = @("global-manager/api/v1", "global-infra/domains/{domainId}/groups")
+            "security-policies" = @("global-manager/api/v1", "global-infra/domains/{domainId}/security-policies")
+            "context-profiles"  = @("global-manager/api/v1", "global-infra/context-profiles")
+            "domains"           = @("policy/api/v1", "global-infra/domains")
+            "deployment"        = @("policy/api/v1", "global-infra")
+        }
+        local = [PSCustomObject]@{
+            "services"          = @("policy/api/v1", "infra/services")
+            "groups"            = @("policy/api/v1", "infra/domains/{domainId}/groups")
+            "security-policies" = @("policy/api/v1", "infra/domains/{domainId}/security-policies")
+            "context-profiles"  = @("policy/api/v1", "infra/context-profiles")
+            "domains"           = @("policy/api/v1", "infra/domains")
+            "deployment"        = @("policy/api/v1", "infra")
+        }
+    }
+
     NSXAPIService([string] $nsxManager, [object] $loggingService, [object] $authService, [object] $configService) : base($loggingService, $authService, $configService) {
         $this.NSXManager = $nsxManager
         $this.logger.LogInfo("NSX API Service initialised with hierarchical support", "NSXAPI")
@@ -63,77 +83,24 @@ class NSXAPIService : CoreAPIService {
 
     # Consolidated URL building method to eliminate duplication
     [object] GetNSXEndpoints([string] $nsxManager, [string] $resourceType, [string] $domainId = "default") {
-        $domains = $this.GetDomains($nsxManager)
+        $domains = $this.GetCachedDomains($nsxManager)
         $isFederated = $this.IsFederatedEnvironment($domains)
         $this.logger.LogInfo("Federation status for $nsxManager : Federated=$isFederated, Domains=$($domains.results.Count)", "NSXAPI")
 
-        $endpoints = [PSCustomObject]@{}
-
-        if ($isFederated) {
-            switch ($resourceType) {
-                "services" {
-                    $endpoints.urlbase = "global-manager/api/v1"
-                    $endpoints.urlpath = "global-infra/services"
-                }
-                "groups" {
-                    $endpoints.urlbase = "global-manager/api/v1"
-                    $endpoints.urlpath = "global-infra/domains/$domainId/groups"
-                }
-                "security-policies" {
-                    $endpoints.urlbase = "global-manager/api/v1"
-                    $endpoints.urlpath = "global-infra/domains/$domainId/security-policies"
-                }
-                "context-profiles" {
-                    $endpoints.urlbase = "global-manager/api/v1"
-                    $endpoints.urlpath = "global-infra/context-profiles"
-                }
-                "domains" {
-                    $endpoints.urlbase = "policy/api/v1"
-                    $endpoints.urlpath = "global-infra/domains"
-                }
-                "deployment" {
-                    $endpoints.urlbase = "policy/api/v1"
-                    $endpoints.urlpath = "global-infra"
-                }
-                default {
-                    throw "Unknown resource type: $resourceType"
-                }
-            }
-        }
-        else {
-            switch ($resourceType) {
-                "services" {
-                    $endpoints.urlbase = "policy/api/v1"
-                    $endpoints.urlpath = "infra/services"
-                }
-                "groups" {
-                    $endpoints.urlbase = "policy/api/v1"
-                    $endpoints.urlpath = "infra/domains/$domainId/groups"
-                }
-                "security-policies" {
-                    $endpoints.urlbase = "policy/api/v1"
-                    $endpoints.urlpath = "infra/domains/$domainId/security-policies"
-                }
-                "context-profiles" {
-                    $endpoints.urlbase = "policy/api/v1"
-                    $endpoints.urlpath = "infra/context-profiles"
-                }
-                "domains" {
-                    $endpoints.urlbase = "policy/api/v1"
-                    $endpoints.urlpath = "infra/domains"
-                }
-                "deployment" {
-                    $endpoints.urlbase = "policy/api/v1"
-                    $endpoints.urlpath = "infra"
-                }
-                default {
-                    throw "Unknown resource type: $resourceType"
-                }
-            }
+        $routes = if ($isFederated) { [NSXAPIService]::endpointTemplates.federated } else { [NSXAPIService]::endpointTemplates.local }
+        if (-not (Get-Member -InputObject $routes -Name $resourceType -MemberType NoteProperty -ErrorAction SilentlyContinue)) {
+            throw "Unknown resource type: $resourceType"
         }
 
-        $endpoints.fullUrl = "https://$nsxManager/$($endpoints.urlbase)/$($endpoints.urlpath)"
-        return $endpoints
+        $route = $routes.$resourceType
+        $urlbase = $route[0]
+        $urlpath = $route[1].Replace('{domainId}', $domainId)
+
+        return [PSCustomObject]@{
+            urlbase = $urlbase
+            urlpath = $urlpath
+            fullUrl = "https://$nsxManager/$urlbase/$urlpath"
+        }
     }
 
     #endregion
@@ -176,14 +143,9 @@ class NSXAPIService : CoreAPIService {
             $this.logger.LogInfo("Deployment endpoint: $fullUrl")
             $this.logger.LogDebug("Deployment endpoint: $urlbase/$urlpath", "NSXAPI")
 
-            # Log the API call start with full details
-            $headers = $this.GetAuthHeaders()
-            $this.logger.LogAPIRequest($httpMethod, $fullUrl, $headers, $jsonPayload)
-
             $result = $this.NSX_REST_Core($urlbase, $urlpath, $httpMethod, "application/json", $jsonPayload)
 
             if ($result) {
-                $this.logger.LogAPIResponse($httpMethod, $fullUrl, 200, $result)
                 $this.logger.LogInfo("Hierarchical configuration deployed successfully")
                 $this.logger.LogInfo("Hierarchical configuration deployed successfully to $nsxManager", "NSXAPI")
                 return $true
@@ -212,13 +174,9 @@ class NSXAPIService : CoreAPIService {
             $endpoints = $this.GetNSXEndpoints($nsxManager, "services")
             $this.logger.LogInfo("Service retrieval endpoint: $($endpoints.fullUrl)")
 
-            $headers = $this.GetAuthHeaders()
-            $this.logger.LogAPIRequest("GET", $endpoints.fullUrl, $headers, $null)
-
             $result = $this.NSX_REST_Core($endpoints.urlbase, $endpoints.urlpath, "GET", "application/json", $null)
 
             if ($result -and $result.results) {
-                $this.logger.LogAPIResponse("GET", $endpoints.fullUrl, 200, $result)
                 $this.logger.LogInfo("Retrieved $($result.results.Count) services from NSX manager $nsxManager", "NSXAPI")
                 return $result
             }
@@ -244,13 +202,9 @@ class NSXAPIService : CoreAPIService {
             $endpoints = $this.GetNSXEndpoints($nsxManager, "groups", $domainId)
             $this.logger.LogInfo("Groups retrieval endpoint: $($endpoints.fullUrl)")
 
-            $headers = $this.GetAuthHeaders()
-            $this.logger.LogAPIRequest("GET", $endpoints.fullUrl, $headers, $null)
-
             $result = $this.NSX_REST_Core($endpoints.urlbase, $endpoints.urlpath, "GET", "application/json", $null)
 
             if ($result -and $result.results) {
-                $this.logger.LogAPIResponse("GET", $endpoints.fullUrl, 200, $result)
                 $this.logger.LogInfo("Retrieved $($result.results.Count) groups from NSX manager $nsxManager", "NSXAPI")
                 return $result
             }
@@ -276,13 +230,9 @@ class NSXAPIService : CoreAPIService {
             $endpoints = $this.GetNSXEndpoints($nsxManager, "security-policies", $domainId)
             $this.logger.LogInfo("Security policies retrieval endpoint: $($endpoints.fullUrl)")
 
-            $headers = $this.GetAuthHeaders()
-            $this.logger.LogAPIRequest("GET", $endpoints.fullUrl, $headers, $null)
-
             $result = $this.NSX_REST_Core($endpoints.urlbase, $endpoints.urlpath, "GET", "application/json", $null)
 
             if ($result -and $result.results) {
-                $this.logger.LogAPIResponse("GET", $endpoints.fullUrl, 200, $result)
                 $this.logger.LogInfo("Retrieved $($result.results.Count) security policies from NSX manager $nsxManager", "NSXAPI")
                 return $result
             }
@@ -374,16 +324,7 @@ class NSXAPIService : CoreAPIService {
 
             # If all attempts failed, create a default domain response for local testing
             $this.logger.LogWarning("Unable to retrieve domains from any endpoint, creating default domain", "NSXAPI")
-            $defaultDomains = [PSCustomObject]@{
-                results      = @(
-                    @{
-                        id            = "default"
-                        display_name  = "default"
-                        resource_type = "Domain"
-                    }
-                )
-                result_count = 1
-            }
+            $defaultDomains = $this.NewDefaultDomains()
 
             return $defaultDomains
 
@@ -440,10 +381,10 @@ class NSXAPIService : CoreAPIService {
         try {
             $this.logger.LogInfo("Exporting hierarchical configuration", "NSXAPI")
 
-            # Create hierarchical structure
+            # Create hierarchical structure - children are lists so each append is O(1) rather than an array copy
             $config = [ordered]@{
                 resource_type = "Infra"
-                children      = @()
+                children      = [System.Collections.Generic.List[object]]::new()
             }
 
             # Get services
@@ -460,7 +401,7 @@ class NSXAPIService : CoreAPIService {
                         service_entries   = $service.service_entries
                     }
                 }
-                $config.children += $childService
+                $config.children.Add($childService)
             }
 
             # Create domain reference
@@ -468,7 +409,7 @@ class NSXAPIService : CoreAPIService {
                 resource_type = "ChildResourceReference"
                 target_type   = "Domain"
                 id            = $domainId
-                children      = @()
+                children      = [System.Collections.Generic.List[object]]::new()
             }
 
             # Get groups
@@ -485,7 +426,7 @@ class NSXAPIService : CoreAPIService {
                         expression        = $group.expression
                     }
                 }
-                $domainRef.children += $childGroup
+                $domainRef.children.Add($childGroup)
             }
 
             # Get security policies
@@ -506,12 +447,12 @@ class NSXAPIService : CoreAPIService {
                         rules           = $policy.rules
                     }
                 }
-                $domainRef.children += $childPolicy
+                $domainRef.children.Add($childPolicy)
             }
 
             # Add domain reference if it has children
             if ($domainRef.children.Count -gt 0) {
-                $config.children += $domainRef
+                $config.children.Add($domainRef)
             }
 
             $this.logger.LogInfo("Hierarchical configuration exported successfully", "NSXAPI")
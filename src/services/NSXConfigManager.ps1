@@ -136,7 +136,7 @@ class NSXConfigManager {
       # Determine the API endpoint based on detected manager type and config type
       $apiEndpoint = switch ($detectedManagerType) {
         "global_manager" {
-          switch ($configType.ToLower()) {
+          switch ($configType) {
             "infra" { $this.urlMappings["global-manager-infra"] }
             "global-infra" { $this.urlMappings["global-manager-infra"] }
             "auto" { $this.urlMappings["global-manager-infra"] }
@@ -144,7 +144,7 @@ class NSXConfigManager {
           }
         }
         "local_manager" {
-          switch ($configType.ToLower()) {
+          switch ($configType) {
             "infra" { $this.urlMappings["global-infra"] }
             "global-infra" { $this.urlMappings["global-infra"] }
             "auto" { $this.urlMappings["global-infra"] }
@@ -152,7 +152,7 @@ class NSXConfigManager {
           }
         }
         "standalone" {
-          switch ($configType.ToLower()) {
+          switch ($configType) {
             "infra" { $this.urlMappings["infra"] }
             "global-infra" { $this.urlMappings["infra"] }  # Fallback to infra for standalone
             "auto" { $this.urlMappings["infra"] }
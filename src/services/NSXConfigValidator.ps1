@@ -977,20 +977,24 @@ class NSXConfigValidator {
       # Convert to JSON and back to ensure we have a fresh object
       $jsonString = $configObject | ConvertTo-Json -Depth 20
 
-      # regex patterns to handle all variations of marked_for_delete
-      # Pattern 1: Remove "marked_for_delete": "value" with optional comma handling
-      $cleanedJson = $jsonString -replace '(?:,\s*)?"marked_for_delete":\s*"[^"]*"(?:\s*,)?', ''
+      # One ordinal scan decides whether the marked_for_delete regex passes are needed at all
+      $cleanedJson = $jsonString
+      if ($jsonString.IndexOf('"marked_for_delete"', [System.StringComparison]::OrdinalIgnoreCase) -ge 0) {
+        # regex patterns to handle all variations of marked_for_delete
+        # Pattern 1: Remove "marked_for_delete": "value" with optional comma handling
+        $cleanedJson = $cleanedJson -replace '(?:,\s*)?"marked_for_delete":\s*"[^"]*"(?:\s*,)?', ''
 
-      # Pattern 2: Remove "marked_for_delete": value (without quotes) with optional comma handling
-      $cleanedJson = $cleanedJson -replace '(?:,\s*)?"marked_for_delete":\s*[^,}\]]*(?:\s*,)?', ''
+        # Pattern 2: Remove "marked_for_delete": value (without quotes) with optional comma handling
+        $cleanedJson = $cleanedJson -replace '(?:,\s*)?"marked_for_delete":\s*[^,}\]]*(?:\s*,)?', ''
 
-      # Pattern 3: Handle edge cases where marked_for_delete is the only field
-      $cleanedJson = $cleanedJson -replace '{\s*"marked_for_delete":\s*"[^"]*"\s*,', '{'
-      $cleanedJson = $cleanedJson -replace '{\s*"marked_for_delete":\s*[^,}\]]*\s*,', '{'
+        # Pattern 3: Handle edge cases where marked_for_delete is the only field
+        $cleanedJson = $cleanedJson -replace '{\s*"marked_for_delete":\s*"[^"]*"\s*,', '{'
+        $cleanedJson = $cleanedJson -replace '{\s*"marked_for_delete":\s*[^,}\]]*\s*,', '{'
 
-      # Pattern 4: Handle marked_for_delete at end of objects
-      $cleanedJson = $cleanedJson -replace ',\s*"marked_for_delete":\s*"[^"]*"\s*}', '}'
-      $cleanedJson = $cleanedJson -replace ',\s*"marked_for_delete":\s*[^,}\]]*\s*}', '}'
+        # Pattern 4: Handle marked_for_delete at end of objects
+        $cleanedJson = $cleanedJson -replace ',\s*"marked_for_delete":\s*"[^"]*"\s*}', '}'
+        $cleanedJson = $cleanedJson -replace ',\s*"marked_for_delete":\s*[^,}\]]*\s*}', '}'
+      }
 
       # Fix PolicyContextProfile app_ids field (NSX-T expects app_id not app_ids)
       $cleanedJson = $cleanedJson -replace '"app_ids":', '"app_id":'
@@ -785,7 +785,7 @@ class NSXDifferentialConfigManager {
     # Create a copy of the object
     $normalised = $obj.PSObject.Copy()
 
-    # List of NSX metadata properties to exclude from comparison
+    # List of NSX metadata properties to exclude from comparison - checked with O(1) property lookups
     $metadataProperties = @(
       'path', 'relative_path', 'parent_path', 'unique_id', 'marked_for_delete', 'overridden',
       '_create_user', '_create_time', '_last_modified_user', '_last_modified_time',
@@ -794,7 +794,7 @@ class NSXDifferentialConfigManager {
 
     # Remove metadata properties from the main object
     foreach ($prop in $metadataProperties) {
-      if ($normalised.PSObject.Properties.Name -contains $prop) {
+      if ($null -ne $normalised.PSObject.Properties[$prop]) {
         $normalised.PSObject.Properties.Remove($prop)
       }
     }
@@ -804,7 +804,7 @@ class NSXDifferentialConfigManager {
       for ($i = 0; $i -lt $normalised.service_entries.Count; $i++) {
         $entry = $normalised.service_entries[$i]
         foreach ($prop in $metadataProperties) {
-          if ($entry.PSObject.Properties.Name -contains $prop) {
+          if ($null -ne $entry.PSObject.Properties[$prop]) {
             $entry.PSObject.Properties.Remove($prop)
           }
         }
@@ -815,7 +815,7 @@ class NSXDifferentialConfigManager {
       for ($i = 0; $i -lt $normalised.expression.Count; $i++) {
         $expr = $normalised.expression[$i]
         foreach ($prop in $metadataProperties) {
-          if ($expr.PSObject.Properties.Name -contains $prop) {
+          if ($null -ne $expr.PSObject.Properties[$prop]) {
             $expr.PSObject.Properties.Remove($prop)
           }
         }
@@ -982,16 +982,24 @@ class NSXDifferentialConfigManager {
 
       # Remove metadata properties
       foreach ($prop in $metadataProperties) {
-        if ($normalized.PSObject.Properties.Name -contains $prop) {
+        if ($null -ne $normalized.PSObject.Properties[$prop]) {
           $normalized.PSObject.Properties.Remove($prop)
         }
       }
 
       # Remove properties not in schema (if schema is available and has properties)
       if ($allSchemaProperties.Count -gt 0) {
+        # Precompute the allowed property set once instead of scanning both lists per property
+        $allowedProperties = [System.Collections.Generic.HashSet[string]]::new([System.StringComparer]::OrdinalIgnoreCase)
+        foreach ($schemaProperty in @($allSchemaProperties) + @($requiredProperties)) {
+          if ($schemaProperty) {
+            [void]$allowedProperties.Add($schemaProperty)
+          }
+        }
+
         $objectProperties = @($normalized.PSObject.Properties.Name)
         foreach ($prop in $objectProperties) {
-          if ($prop -notin $allSchemaProperties -and $prop -notin $requiredProperties) {
+          if (-not $allowedProperties.Contains($prop)) {
             $this.logger.LogDebug("Removing non-schema property: $prop", "DifferentialConfig")
             $normalized.PSObject.Properties.Remove($prop)
           }
@@ -107,7 +107,7 @@ class NSXHierarchicalAPIService {
         $domainRef = $this.CreateDomainReference()
 
         try {
-            switch ($objectType.ToLower()) {
+            switch ($objectType) {
                 "services" {
                     $this.RetrieveServices($nsxManager, $config)
                 }
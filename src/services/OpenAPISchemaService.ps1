@@ -20,6 +20,17 @@ class OpenAPISchemaService {
   hidden [DateTime] $endpointCacheExpiry
   hidden [int] $endpointCacheTTLHours
   hidden [bool] $isConfigured
+  hidden [object] $schemasDirectoryCache = [PSCustomObject]@{}
+  hidden [regex] $excludePatternRegex
+  hidden [object] $excludePatternList
+  hidden [object] $resourceTypeRegexCache = [PSCustomObject]@{}
+
+  # Local schema cache file names by schema type - built once and shared by load and save
+  hidden static [object] $schemaCacheFiles = [PSCustomObject]@{
+    "policy_openapi" = "policy_openapi_schema.json"
+    "policy_swagger" = "policy_swagger_schema.json"
+    "management_api" = "management_api_schema.json"
+  }
 
   # Constructor with dependency injection (basic)
   OpenAPISchemaService([object] $loggingService = $null, [object] $authService = $null, [object] $apiService = $null, [object] $fileNamingService = $null, [object] $workflowService = $null) {
@@ -451,6 +462,12 @@ class OpenAPISchemaService {
 
   # Get schemas directory path for specific NSX Manager
   hidden [string] GetSchemasDirectoryPath() {
+    # Directory already resolved and created for this manager - skip path building and the existence check
+    $cacheKey = if ($this.nsxManager) { $this.nsxManager } else { "default" }
+    if ((Get-Member -InputObject $this.schemasDirectoryCache -Name $cacheKey -MemberType NoteProperty -ErrorAction SilentlyContinue)) {
+      return $this.schemasDirectoryCache.$cacheKey
+    }
+
     try {
       # Get schemas base directory from toolkit paths
       $schemasBaseDir = if ($this.workflowService) {
@@ -482,6 +499,7 @@ class OpenAPISchemaService {
         }
       }
 
+      $this.schemasDirectoryCache | Add-Member -NotePropertyName $cacheKey -NotePropertyValue $managerDir -Force
       return $managerDir
     }
     catch {
@@ -504,11 +522,7 @@ class OpenAPISchemaService {
       $cacheValidHours = 24  # 24-hour TTL for schema cache files
 
       # Check for cached schema files
-      $schemaFiles = [PSCustomObject]@{
-        "policy_openapi" = "policy_openapi_schema.json"
-        "policy_swagger" = "policy_swagger_schema.json"
-        "management_api" = "management_api_schema.json"
-      }
+      $schemaFiles = [OpenAPISchemaService]::schemaCacheFiles
 
       # Replace hash table iteration with PSCustomObject property access
       $schemaFileProperties = ($schemaFiles | Get-Member -MemberType NoteProperty).Name
@@ -572,11 +586,7 @@ class OpenAPISchemaService {
       }
 
       # Schema file mapping
-      $schemaFiles = [PSCustomObject]@{
-        "policy_openapi" = "policy_openapi_schema.json"
-        "policy_swagger" = "policy_swagger_schema.json"
-        "management_api" = "management_api_schema.json"
-      }
+      $schemaFiles = [OpenAPISchemaService]::schemaCacheFiles
 
       # Replace hash table iteration with PSCustomObject property access
       $allSchemasProperties = ($allSchemas | Get-Member -MemberType NoteProperty).Name
@@ -588,10 +598,35 @@ class OpenAPISchemaService {
           try {
             # Convert schema to compressed JSON and save - replace hash table indexing with PSCustomObject property access
             $jsonContent = $allSchemas.$schemaType | ConvertTo-Json -Depth 50 -Compress
-            $jsonContent | Out-File -FilePath $filePath -Encoding UTF8
 
-            if ($this.logger) {
-              $this.logger.LogDebug("Saved $schemaType schema to: $filePath", "OpenAPISchema")
+            # Identical schema already on disk - refresh its timestamp for the TTL instead of rewriting it
+            $fileInfo = [System.IO.FileInfo]::new($ExecutionContext.SessionState.Path.GetUnresolvedProviderPathFromPSPath($filePath))
+            $unchanged = $false
+            $sizeDelta = -1
+            if ($fileInfo.Exists) {
+              $sizeDelta = $fileInfo.Length - [System.Text.Encoding]::UTF8.GetByteCount($jsonContent)
+            }
+            # Only a file within a BOM and trailing newline of the new JSON can match - skip reading anything else
+            if ($sizeDelta -ge 0 -and $sizeDelta -le 5) {
+              $existingContent = [System.IO.File]::ReadAllText($fileInfo.FullName)
+              $unchanged = $existingContent.Length -ge $jsonContent.Length -and
+                [string]::CompareOrdinal($existingContent, 0, $jsonContent, 0, $jsonContent.Length) -eq 0 -and
+                [string]::IsNullOrWhiteSpace($existingContent.Substring($jsonContent.Length))
+            }
+
+            if ($unchanged) {
+              $fileInfo.LastWriteTime = Get-Date
+
+              if ($this.logger) {
+                $this.logger.LogDebug("Cached $schemaType schema unchanged, refreshed timestamp: $filePath", "OpenAPISchema")
+              }
+            }
+            else {
+              $jsonContent | Out-File -FilePath $filePath -Encoding UTF8
+
+              if ($this.logger) {
+                $this.logger.LogDebug("Saved $schemaType schema to: $filePath", "OpenAPISchema")
+              }
             }
           }
           catch {
@@ -649,13 +684,15 @@ class OpenAPISchemaService {
     $relevantPaths = [PSCustomObject]@{}
 
     if ($schema.paths) {
+      $resourceTypeRegex = $this.GetResourceTypeRegex($resourceType)
+
       # Replace hash table iteration with PSCustomObject property access
-      $pathProperties = ($schema.paths | Get-Member -MemberType NoteProperty).Name
-      foreach ($path in $pathProperties) {
-        $pathInfo = $schema.paths.$path
+      foreach ($pathProperty in $schema.paths.PSObject.Properties) {
+        $path = $pathProperty.Name
+        $pathInfo = $pathProperty.Value
 
         # Check if path is related to resource type
-        if ($path -match $resourceType -or
+        if ($resourceTypeRegex.IsMatch($path) -or
           ($pathInfo.get -and $pathInfo.get.tags -contains $resourceType) -or
           ($pathInfo.post -and $pathInfo.post.tags -contains $resourceType) -or
           ($pathInfo.put -and $pathInfo.put.tags -contains $resourceType) -or
@@ -1601,6 +1638,30 @@ class OpenAPISchemaService {
     }
   }
 
+  # Compile each resource type pattern once per service - specs carry thousands of paths and each type is filtered repeatedly
+  hidden [regex] GetResourceTypeRegex([string] $resourceType) {
+    if (-not (Get-Member -InputObject $this.resourceTypeRegexCache -Name $resourceType -MemberType NoteProperty -ErrorAction SilentlyContinue)) {
+      $resourceTypeRegex = [regex]::new($resourceType, [System.Text.RegularExpressions.RegexOptions]'Compiled, IgnoreCase')
+      $this.resourceTypeRegexCache | Add-Member -NotePropertyName $resourceType -NotePropertyValue $resourceTypeRegex -Force
+    }
+    return $this.resourceTypeRegexCache.$resourceType
+  }
+
+  # Fuse the endpoint exclude patterns into one alternation, rebuilt only when the configured list is replaced
+  hidden [regex] GetExcludePatternRegex() {
+    $patterns = $this.config.endpoint_validation.exclude_patterns
+    if (-not $patterns) {
+      return $null
+    }
+
+    if (-not [object]::ReferenceEquals($patterns, $this.excludePatternList)) {
+      $alternatives = foreach ($pattern in $patterns) { "(?:$pattern)" }
+      $this.excludePatternRegex = [regex]::new(($alternatives -join '|'), [System.Text.RegularExpressions.RegexOptions]'Compiled, IgnoreCase')
+      $this.excludePatternList = $patterns
+    }
+    return $this.excludePatternRegex
+  }
+
   # Test individual endpoint for validity and data availability
   [object] TestEndpoint([string] $endpoint, [string] $method = "GET") {
     $testResult = [PSCustomObject]@{
@@ -1621,11 +1682,14 @@ class OpenAPISchemaService {
       return $testResult
     }
 
-    # Skip destructive endpoints
-    foreach ($pattern in $this.config.endpoint_validation.exclude_patterns) {
-      if ($endpoint -match $pattern) {
-        $testResult.error = "Endpoint excluded by pattern: $pattern"
-        return $testResult
+    # Skip destructive endpoints - one pass over the fused patterns, per-pattern scan only to report a hit
+    $excludeRegex = $this.GetExcludePatternRegex()
+    if ($excludeRegex -and $excludeRegex.IsMatch($endpoint)) {
+      foreach ($pattern in $this.config.endpoint_validation.exclude_patterns) {
+        if ($endpoint -match $pattern) {
+          $testResult.error = "Endpoint excluded by pattern: $pattern"
+          return $testResult
+        }
       }
     }
 
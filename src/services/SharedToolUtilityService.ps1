@@ -21,6 +21,9 @@
 class SharedToolUtilityService {
   [object] $logger
 
+  # Parsed JSON files shared by all callers, keyed by full path and invalidated on write time
+  hidden static [object] $jsonFileCache = [PSCustomObject]@{}
+
   # Constructor
   SharedToolUtilityService([object] $logger) {
     $this.logger = $logger
@@ -392,6 +395,27 @@ class SharedToolUtilityService {
     return Get-Date -Format "yyyyMMdd_HHmmss"
   }
 
+  # Read and parse a JSON file, reusing the parsed document until the file is rewritten
+  # The returned object is shared - callers must copy it before modifying it
+  static [object] ReadJsonFileCached([string] $filePath) {
+    $fileInfo = Get-Item -LiteralPath $filePath
+    $cacheKey = $fileInfo.FullName
+    $fileCache = [SharedToolUtilityService]::jsonFileCache
+
+    if ((Get-Member -InputObject $fileCache -Name $cacheKey -MemberType NoteProperty -ErrorAction SilentlyContinue) -and
+      $fileCache.$cacheKey.writeTime -eq $fileInfo.LastWriteTimeUtc) {
+      return $fileCache.$cacheKey.content
+    }
+
+    $jsonContent = Get-Content -LiteralPath $cacheKey -Raw | ConvertFrom-Json
+    $cachedFile = [PSCustomObject]@{
+      writeTime = $fileInfo.LastWriteTimeUtc
+      content   = $jsonContent
+    }
+    $fileCache | Add-Member -NotePropertyName $cacheKey -NotePropertyValue $cachedFile -Force
+    return $jsonContent
+  }
+
   # Mask sensitive information in output
   [string] MaskSensitiveInfo([string] $input) {
     $masked = $input
@@ -13,6 +13,26 @@ if (-not ('CoreAPIService' -as [type])) {
 class UniversalAPIService : CoreAPIService {
     [string]$APIEndpoint
 
+    # Endpoint route templates (hierarchical or flat) by resource type - built once, {domainId} substituted per call
+    hidden static [object] $endpointTemplates = [PSCustomObject]@{
+        hierarchical = [PSCustomObject]@{
+            "services"          = @("global-manager/api/v1", "global-infra/services")
+            "groups"            = @("global-manager/api/v1", "global-infra/domains/{domainId}/groups")
+            "security-policies" = @("global-manager/api/v1", "global-infra/domains/{domainId}/security-policies")
+            "context-profiles"  = @("global-manager/api/v1", "global-infra/context-profiles")
+            "domains"           = @("policy/api/v1", "global-infra/domains")
+            "deployment"        = @("policy/api/v1", "global-infra")
+        }
+        flat = [PSCustomObject]@{
+            "services"          = @("policy/api/v1", "infra/services")
+            "groups"            = @("policy/api/v1", "infra/domains/{domainId}/groups")
+            "security-policies" = @("policy/api/v1", "infra/domains/{domainId}/security-policies")
+            "context-profiles"  = @("policy/api/v1", "infra/context-profiles")
+            "domains"           = @("policy/api/v1", "infra/domains")
+            "deployment"        = @("policy/api/v1", "infra")
+        }
+    }
+
     UniversalAPIService([string] $apiEndpoint, [object] $loggingService, [object] $authService, [object] $configService) : base($loggingService, $authService, $configService) {
         $this.APIEndpoint = $apiEndpoint
         $this.logger.LogInfo("API Service initialised with hierarchical support", "UniversalAPI")
@@ -70,77 +90,24 @@ class UniversalAPIService : CoreAPIService {
 
     # Generic endpoint builder for various API types
     [object] GetAPIEndpoints([string] $apiEndpoint, [string] $resourceType, [string] $domainId = "default") {
-        $domains = $this.GetDomains($apiEndpoint)
+        $domains = $this.GetCachedDomains($apiEndpoint)
         $isHierarchical = $this.IsHierarchicalEnvironment($domains)
         $this.logger.LogInfo("API structure for $apiEndpoint : Hierarchical=$isHierarchical, Domains=$($domains.results.Count)", "UniversalAPI")
 
-        $endpoints = [PSCustomObject]@{}
-
-        if ($isHierarchical) {
-            switch ($resourceType) {
-                "services" {
-                    $endpoints.urlbase = "global-manager/api/v1"
-                    $endpoints.urlpath = "global-infra/services"
-                }
-                "groups" {
-                    $endpoints.urlbase = "global-manager/api/v1"
-                    $endpoints.urlpath = "global-infra/domains/$domainId/groups"
-                }
-                "security-policies" {
-                    $endpoints.urlbase = "global-manager/api/v1"
-                    $endpoints.urlpath = "global-infra/domains/$domainId/security-policies"
-                }
-                "context-profiles" {
-                    $endpoints.urlbase = "global-manager/api/v1"
-                    $endpoints.urlpath = "global-infra/context-profiles"
-                }
-                "domains" {
-                    $endpoints.urlbase = "policy/api/v1"
-                    $endpoints.urlpath = "global-infra/domains"
-                }
-                "deployment" {
-                    $endpoints.urlbase = "policy/api/v1"
-                    $endpoints.urlpath = "global-infra"
-                }
-                default {
-                    throw "Unknown resource type: $resourceType"
-                }
-            }
-        }
-        else {
-            switch ($resourceType) {
-                "services" {
-                    $endpoints.urlbase = "policy/api/v1"
-                    $endpoints.urlpath = "infra/services"
-                }
-                "groups" {
-                    $endpoints.urlbase = "policy/api/v1"
-                    $endpoints.urlpath = "infra/domains/$domainId/groups"
-                }
-                "security-policies" {
-                    $endpoints.urlbase = "policy/api/v1"
-                    $endpoints.urlpath = "infra/domains/$domainId/security-policies"
-                }
-                "context-profiles" {
-                    $endpoints.urlbase = "policy/api/v1"
-                    $endpoints.urlpath = "infra/context-profiles"
-                }
-                "domains" {
-                    $endpoints.urlbase = "policy/api/v1"
-                    $endpoints.urlpath = "infra/domains"
-                }
-                "deployment" {
-                    $endpoints.urlbase = "policy/api/v1"
-                    $endpoints.urlpath = "infra"
-                }
-                default {
-                    throw "Unknown resource type: $resourceType"
-                }
-            }
+        $routes = if ($isHierarchical) { [UniversalAPIService]::endpointTemplates.hierarchical } else { [UniversalAPIService]::endpointTemplates.flat }
+        if (-not (Get-Member -InputObject $routes -Name $resourceType -MemberType NoteProperty -ErrorAction SilentlyContinue)) {
+            throw "Unknown resource type: $resourceType"
         }
 
-        $endpoints.fullUrl = "https://$apiEndpoint/$($endpoints.urlbase)/$($endpoints.urlpath)"
-        return $endpoints
+        $route = $routes.$resourceType
+        $urlbase = $route[0]
+        $urlpath = $route[1].Replace('{domainId}', $domainId)
+
+        return [PSCustomObject]@{
+            urlbase = $urlbase
+            urlpath = $urlpath
+            fullUrl = "https://$apiEndpoint/$urlbase/$urlpath"
+        }
     }
 
     #endregion
@@ -181,14 +148,9 @@ class UniversalAPIService : CoreAPIService {
             $this.logger.LogInfo("Deployment endpoint: $fullUrl")
             $this.logger.LogDebug("Deployment endpoint: $urlbase/$urlpath", "UniversalAPI")
 
-            # Log the API call start with full details
-            $headers = $this.GetAuthHeaders()
-            $this.logger.LogAPIRequest($httpMethod, $fullUrl, $headers, $jsonPayload)
-
             $result = $this.Universal_REST_Core($urlbase, $urlpath, $httpMethod, "application/json", $jsonPayload)
 
             if ($result) {
-                $this.logger.LogAPIResponse($httpMethod, $fullUrl, 200, $result)
                 $this.logger.LogInfo("Hierarchical configuration deployed successfully")
                 $this.logger.LogInfo("Hierarchical configuration deployed successfully to $apiEndpoint", "UniversalAPI")
                 return $true
@@ -217,13 +179,9 @@ class UniversalAPIService : CoreAPIService {
             $endpoints = $this.GetAPIEndpoints($apiEndpoint, "services")
             $this.logger.LogInfo("Service retrieval endpoint: $($endpoints.fullUrl)")
 
-            $headers = $this.GetAuthHeaders()
-            $this.logger.LogAPIRequest("GET", $endpoints.fullUrl, $headers, $null)
-
             $result = $this.Universal_REST_Core($endpoints.urlbase, $endpoints.urlpath, "GET", "application/json", $null)
 
             if ($result -and $result.results) {
-                $this.logger.LogAPIResponse("GET", $endpoints.fullUrl, 200, $result)
                 $this.logger.LogInfo("Retrieved $($result.results.Count) services from API endpoint $apiEndpoint", "UniversalAPI")
                 return $result
             }
@@ -249,13 +207,9 @@ class UniversalAPIService : CoreAPIService {
             $endpoints = $this.GetAPIEndpoints($apiEndpoint, "groups", $domainId)
             $this.logger.LogInfo("Groups retrieval endpoint: $($endpoints.fullUrl)")
 
-            $headers = $this.GetAuthHeaders()
-            $this.logger.LogAPIRequest("GET", $endpoints.fullUrl, $headers, $null)
-
             $result = $this.Universal_REST_Core($endpoints.urlbase, $endpoints.urlpath, "GET", "application/json", $null)
 
             if ($result -and $result.results) {
-                $this.logger.LogAPIResponse("GET", $endpoints.fullUrl, 200, $result)
                 $this.logger.LogInfo("Retrieved $($result.results.Count) groups from API endpoint $apiEndpoint", "UniversalAPI")
                 return $result
             }
@@ -281,13 +235,9 @@ class UniversalAPIService : CoreAPIService {
             $endpoints = $this.GetAPIEndpoints($apiEndpoint, "security-policies", $domainId)
             $this.logger.LogInfo("Security policies retrieval endpoint: $($endpoints.fullUrl)")
 
-            $headers = $this.GetAuthHeaders()
-            $this.logger.LogAPIRequest("GET", $endpoints.fullUrl, $headers, $null)
-
             $result = $this.Universal_REST_Core($endpoints.urlbase, $endpoints.urlpath, "GET", "application/json", $null)
 
             if ($result -and $result.results) {
-                $this.logger.LogAPIResponse("GET", $endpoints.fullUrl, 200, $result)
                 $this.logger.LogInfo("Retrieved $($result.results.Count) security policies from API endpoint $apiEndpoint", "UniversalAPI")
                 return $result
             }
@@ -379,16 +329,7 @@ class UniversalAPIService : CoreAPIService {
 
             # If all attempts failed, create a default domain response for testing
             $this.logger.LogWarning("Unable to retrieve domains from any endpoint, creating default domain", "UniversalAPI")
-            $defaultDomains = [PSCustomObject]@{
-                results      = @(
-                    @{
-                        id            = "default"
-                        display_name  = "default"
-                        resource_type = "Domain"
-                    }
-                )
-                result_count = 1
-            }
+            $defaultDomains = $this.NewDefaultDomains()
 
             return $defaultDomains
 
@@ -445,10 +386,10 @@ class UniversalAPIService : CoreAPIService {
         try {
             $this.logger.LogInfo("Exporting hierarchical configuration", "UniversalAPI")
 
-            # Create hierarchical structure
+            # Create hierarchical structure - children are lists so each append is O(1) rather than an array copy
             $config = [ordered]@{
                 resource_type = "Infra"
-                children      = @()
+                children      = [System.Collections.Generic.List[object]]::new()
             }
 
             # Get services
@@ -465,7 +406,7 @@ class UniversalAPIService : CoreAPIService {
                         service_entries   = $service.service_entries
                     }
                 }
-                $config.children += $childService
+                $config.children.Add($childService)
             }
 
             # Create domain reference
@@ -473,7 +414,7 @@ class UniversalAPIService : CoreAPIService {
                 resource_type = "ChildResourceReference"
                 target_type   = "Domain"
                 id            = $domainId
-                children      = @()
+                children      = [System.Collections.Generic.List[object]]::new()
             }
 
             # Get groups
@@ -490,7 +431,7 @@ class UniversalAPIService : CoreAPIService {
                         expression        = $group.expression
                     }
                 }
-                $domainRef.children += $childGroup
+                $domainRef.children.Add($childGroup)
             }
 
             # Get security policies
@@ -511,12 +452,12 @@ class UniversalAPIService : CoreAPIService {
                         rules           = $policy.rules
                     }
                 }
-                $domainRef.children += $childPolicy
+                $domainRef.children.Add($childPolicy)
             }
 
             # Add domain reference if it has children
             if ($domainRef.children.Count -gt 0) {
-                $config.children += $domainRef
+                $config.children.Add($domainRef)
             }
 
             $this.logger.LogInfo("Hierarchical configuration exported successfully", "UniversalAPI")
@@ -913,7 +913,9 @@ class WorkflowOperationsService {
   hidden [void] LoadToolkitPathsConfiguration() {
     try {
       if (Test-Path $this.pathsConfigFilePath) {
-        $jsonContent = Get-Content -Path $this.pathsConfigFilePath -Raw | ConvertFrom-Json
+        $jsonContent = [SharedToolUtilityService]::ReadJsonFileCached($this.pathsConfigFilePath)
+
+        # Conversion deep-copies per instance, so the shared parsed copy is never mutated
         $this.toolkitPathsConfig = $this.ConvertPSObjectToHashtable($jsonContent)
 
         if ($this.logger) {
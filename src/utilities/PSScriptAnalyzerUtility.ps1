@@ -153,7 +153,8 @@ $UTILITY_VERSION = "2.0.0"
 $UTILITY_PURPOSE = "MANDATORY CODE QUALITY ENFORCEMENT WITH AUTO-FIX (DEFAULT)"
 $UTILITY_STATUS = "CRITICAL SYSTEM UTILITY - DO NOT REMOVE OR MODIFY"
 $PROTOCOL_COMPLIANCE = "MANDATORY - ALL CODE MUST PASS ANALYSIS"
-$LOG_FILE = "C:\GitHub_Development\powershell-api-orchestrator-toolkit\src\utilities\PSScriptAnalyzerUtility.log"
+$LOG_FILE = Join-Path $PSScriptRoot "logs\PSScriptAnalyzerUtility.log"
+$logWriter = $null
 
 # PSScriptAnalyzer severity mapping
 $SEVERITY_LEVELS = [PSCustomObject]@{
@@ -169,6 +170,94 @@ $DEFAULT_EXCLUDED_RULES = @(
   "PSUseShouldProcessForStateChangingFunctions"  # Not all functions need ShouldProcess
 )
 
+# Cmdlet alias expansions used by Repair-CmdletAlias (built once per run, not per line)
+$CMDLET_ALIAS_MAP = [PSCustomObject]@{
+  'ls'      = 'Get-ChildItem'
+  'dir'     = 'Get-ChildItem'
+  'gci'     = 'Get-ChildItem'
+  'cat'     = 'Get-Content'
+  'gc'      = 'Get-Content'
+  'type'    = 'Get-Content'
+  'echo'    = 'Write-Output'
+  'write'   = 'Write-Output'
+  'cls'     = 'Clear-Host'
+  'clear'   = 'Clear-Host'
+  'cd'      = 'Set-Location'
+  'chdir'   = 'Set-Location'
+  'sl'      = 'Set-Location'
+  'pwd'     = 'Get-Location'
+  'gl'      = 'Get-Location'
+  'copy'    = 'Copy-Item'
+  'cp'      = 'Copy-Item'
+  'cpi'     = 'Copy-Item'
+  'move'    = 'Move-Item'
+  'mv'      = 'Move-Item'
+  'mi'      = 'Move-Item'
+  'del'     = 'Remove-Item'
+  'rm'      = 'Remove-Item'
+  'ri'      = 'Remove-Item'
+  'rmdir'   = 'Remove-Item'
+  'rd'      = 'Remove-Item'
+  'md'      = 'New-Item'
+  'mkdir'   = 'New-Item'
+  'ni'      = 'New-Item'
+  'select'  = 'Select-Object'
+  'where'   = 'Where-Object'
+  'foreach' = 'ForEach-Object'
+  'sort'    = 'Sort-Object'
+  'group'   = 'Group-Object'
+  'measure' = 'Measure-Object'
+  'compare' = 'Compare-Object'
+  'tee'     = 'Tee-Object'
+  'out'     = 'Out-String'
+  'ft'      = 'Format-Table'
+  'fl'      = 'Format-List'
+  'fw'      = 'Format-Wide'
+  'gm'      = 'Get-Member'
+  'gps'     = 'Get-Process'
+  'ps'      = 'Get-Process'
+  'kill'    = 'Stop-Process'
+  'spps'    = 'Stop-Process'
+  'gsv'     = 'Get-Service'
+  'sasv'    = 'Start-Service'
+  'spsv'    = 'Stop-Service'
+  'set'     = 'Set-Variable'
+  'sv'      = 'Set-Variable'
+  'gv'      = 'Get-Variable'
+  'rv'      = 'Remove-Variable'
+  'clv'     = 'Clear-Variable'
+  'sal'     = 'Set-Alias'
+  'gal'     = 'Get-Alias'
+  'nal'     = 'New-Alias'
+  'epal'    = 'Export-Alias'
+  'ipal'    = 'Import-Alias'
+  'gwmi'    = 'Get-WmiObject'
+  'iwmi'    = 'Invoke-WmiMethod'
+  'ogv'     = 'Out-GridView'
+  'shcm'    = 'Show-Command'
+}
+
+# Precompiled auto-fix patterns, case-insensitive like the -match/-replace operators they replace
+$REPAIR_REGEX_OPTIONS = [System.Text.RegularExpressions.RegexOptions]'Compiled, IgnoreCase'
+$WRITE_HOST_REGEX = [regex]::new('Write-Host\s+(.+)', $REPAIR_REGEX_OPTIONS)
+$EMPTY_CATCH_REGEX = [regex]::new('^\s*catch\s*\{\s*\}', $REPAIR_REGEX_OPTIONS)
+$VARIABLE_ASSIGNMENT_REGEX = [regex]::new('\$\w+\s*=\s*.+', $REPAIR_REGEX_OPTIONS)
+$MANDATORY_PARAMETER_REGEX = [regex]::new('\[Parameter\(.*Mandatory\s*=\s*\$true.*\)\]', $REPAIR_REGEX_OPTIONS)
+$CMDLET_ALIAS_REGEX = [regex]::new('\b(' + (($CMDLET_ALIAS_MAP.PSObject.Properties.Name | ForEach-Object { [regex]::Escape($_) }) -join '|') + ')\b', $REPAIR_REGEX_OPTIONS)
+
+# Auto-fix function for each supported rule, used by Get-AutoFixFunction
+$AUTO_FIX_FUNCTIONS = [PSCustomObject]@{
+  'PSAvoidUsingWriteHost'                          = 'Repair-WriteHost'
+  'PSAvoidUsingCmdletAliases'                      = 'Repair-CmdletAlias'
+  'PSUseDeclaredVarsMoreThanAssignments'           = 'Repair-UnusedVariable'
+  'PSAvoidUsingPlainTextForPassword'               = 'Repair-PlainTextPassword'
+  'PSAvoidUsingConvertToSecureStringWithPlainText' = 'Repair-ConvertToSecureString'
+  'PSAvoidUsingEmptyCatchBlock'                    = 'Repair-EmptyCatchBlock'
+  'PSUseApprovedVerbs'                             = 'Repair-UnapprovedVerb'
+  'PSUseSingularNouns'                             = 'Repair-PluralNoun'
+  'PSAvoidDefaultValueForMandatoryParameter'       = 'Repair-MandatoryParameterDefault'
+}
+
 # ===================================================================
 # LOGGING FUNCTIONS
 # ===================================================================
@@ -194,7 +283,9 @@ Purpose: $UTILITY_PURPOSE
 ================================================================
 
 "@
-    Set-Content -Path $LogPath -Value $header -Encoding UTF8
+    # Keep one buffered writer open for the whole run - entries are flushed in batches, not per line
+    $script:logWriter = [System.IO.StreamWriter]::new($LogPath, $false, [System.Text.Encoding]::UTF8, 65536)
+    $script:logWriter.Write($header)
     return $true
   }
   catch {
@@ -203,6 +294,14 @@ Purpose: $UTILITY_PURPOSE
   }
 }
 
+# Flush and close the log writer opened by Initialize-Logging
+function Close-Logging {
+  if ($script:logWriter) {
+    $script:logWriter.Dispose()
+    $script:logWriter = $null
+  }
+}
+
 # Write to log file
 function Write-Log {
   param(
@@ -213,13 +312,24 @@ function Write-Log {
   $timestamp = Get-Date -Format "yyyy-MM-dd HH:mm:ss"
   $logEntry = "[$timestamp] [$Level] $Message"
 
-  try {
-    Add-Content -Path $LOG_FILE -Value $logEntry -Encoding UTF8
-  }
-  catch {
-    # Fallback to console if logging fails
+  # Skip the file write entirely when the log could not be initialized
+  if (-not $script:logWriter) {
     Write-Host $logEntry
   }
+  else {
+    try {
+      $script:logWriter.WriteLine($logEntry)
+
+      # Errors are flushed immediately so they survive an abrupt termination
+      if ($Level -eq "ERROR") {
+        $script:logWriter.Flush()
+      }
+    }
+    catch {
+      # Fallback to console if logging fails
+      Write-Host $logEntry
+    }
+  }
 
   if ($Verbose) {
     $color = switch ($Level) {
@@ -263,6 +373,28 @@ function New-FileBackup {
   }
 }
 
+# Read file lines and the encoding to write them back with
+function Read-FileContent {
+  param([string]$FilePath)
+
+  # BOM decides the encoding - BOM-less files use what Get-Content assumes on this host
+  $fallbackEncoding = if ($PSVersionTable.PSVersion.Major -ge 6) { [System.Text.UTF8Encoding]::new($false) } else { [System.Text.Encoding]::Default }
+  $lines = [System.Collections.Generic.List[string]]::new()
+  $reader = [System.IO.StreamReader]::new($FilePath, $fallbackEncoding, $true)
+  try {
+    while ($null -ne ($line = $reader.ReadLine())) {
+      $lines.Add($line)
+    }
+    return [PSCustomObject]@{
+      Lines    = $lines.ToArray()
+      Encoding = $reader.CurrentEncoding
+    }
+  }
+  finally {
+    $reader.Dispose()
+  }
+}
+
 # ===================================================================
 # AUTO-FIX FUNCTIONS FOR COMMON VIOLATIONS
 # ===================================================================
@@ -271,9 +403,9 @@ function New-FileBackup {
 function Repair-WriteHost {
   param([string]$Line)
 
-  if ($Line -match 'Write-Host\s+(.+)') {
-    $message = $Matches[1]
-    $fixed = $Line -replace 'Write-Host\s+(.+)', 'Write-Information $1'
+  # Single replace pass - an unchanged result means there was nothing to fix
+  $fixed = $WRITE_HOST_REGEX.Replace($Line, 'Write-Information $1')
+  if ($fixed -cne $Line) {
     Write-Log "Fixed WriteHost: Write-Host -> Write-Information" -Level "FIXED"
     return $fixed
   }
@@ -284,80 +416,12 @@ function Repair-WriteHost {
 function Repair-CmdletAlias {
   param([string]$Line)
 
-  $aliasMap = [PSCustomObject]@{
-    'ls'      = 'Get-ChildItem'
-    'dir'     = 'Get-ChildItem'
-    'gci'     = 'Get-ChildItem'
-    'cat'     = 'Get-Content'
-    'gc'      = 'Get-Content'
-    'type'    = 'Get-Content'
-    'echo'    = 'Write-Output'
-    'write'   = 'Write-Output'
-    'cls'     = 'Clear-Host'
-    'clear'   = 'Clear-Host'
-    'cd'      = 'Set-Location'
-    'chdir'   = 'Set-Location'
-    'sl'      = 'Set-Location'
-    'pwd'     = 'Get-Location'
-    'gl'      = 'Get-Location'
-    'copy'    = 'Copy-Item'
-    'cp'      = 'Copy-Item'
-    'cpi'     = 'Copy-Item'
-    'move'    = 'Move-Item'
-    'mv'      = 'Move-Item'
-    'mi'      = 'Move-Item'
-    'del'     = 'Remove-Item'
-    'rm'      = 'Remove-Item'
-    'ri'      = 'Remove-Item'
-    'rmdir'   = 'Remove-Item'
-    'rd'      = 'Remove-Item'
-    'md'      = 'New-Item'
-    'mkdir'   = 'New-Item'
-    'ni'      = 'New-Item'
-    'select'  = 'Select-Object'
-    'where'   = 'Where-Object'
-    'foreach' = 'ForEach-Object'
-    'sort'    = 'Sort-Object'
-    'group'   = 'Group-Object'
-    'measure' = 'Measure-Object'
-    'compare' = 'Compare-Object'
-    'tee'     = 'Tee-Object'
-    'out'     = 'Out-String'
-    'ft'      = 'Format-Table'
-    'fl'      = 'Format-List'
-    'fw'      = 'Format-Wide'
-    'gm'      = 'Get-Member'
-    'gps'     = 'Get-Process'
-    'ps'      = 'Get-Process'
-    'kill'    = 'Stop-Process'
-    'spps'    = 'Stop-Process'
-    'gsv'     = 'Get-Service'
-    'sasv'    = 'Start-Service'
-    'spsv'    = 'Stop-Service'
-    'set'     = 'Set-Variable'
-    'sv'      = 'Set-Variable'
-    'gv'      = 'Get-Variable'
-    'rv'      = 'Remove-Variable'
-    'clv'     = 'Clear-Variable'
-    'sal'     = 'Set-Alias'
-    'gal'     = 'Get-Alias'
-    'nal'     = 'New-Alias'
-    'epal'    = 'Export-Alias'
-    'ipal'    = 'Import-Alias'
-    'gwmi'    = 'Get-WmiObject'
-    'iwmi'    = 'Invoke-WmiMethod'
-    'ogv'     = 'Out-GridView'
-    'shcm'    = 'Show-Command'
-  }
-
   $originalLine = $Line
-  foreach ($alias in $aliasMap.PSObject.Properties.Name) {
-    $fullName = $aliasMap.$alias
-    $pattern = "\b$alias\b"
-    if ($Line -match $pattern) {
-      $Line = $Line -replace $pattern, $fullName
-    }
-  }
+  # One scan over the alias alternation; each matched alias is looked up and expanded exactly once
+  $Line = $CMDLET_ALIAS_REGEX.Replace($Line, [System.Text.RegularExpressions.MatchEvaluator] {
+      param($aliasMatch)
+      $CMDLET_ALIAS_MAP.($aliasMatch.Value)
+    })
 
   if ($Line -ne $originalLine) {
     Write-Log "Fixed CmdletAliases: Expanded aliases to full cmdlet names" -Level "FIXED"
@@ -372,7 +436,7 @@ function Repair-UnusedVariable {
 
   # This is complex and may require manual intervention
   # For now, just log for manual review
-  if ($Line -match '\$\w+\s*=\s*.+') {
+  if ($VARIABLE_ASSIGNMENT_REGEX.IsMatch($Line)) {
     Write-Log "UnusedVariable detected (manual review required): $($Line.Trim())" -Level "WARNING"
   }
   return $Line
@@ -398,8 +462,8 @@ function Repair-ConvertToSecureString {
 function Repair-EmptyCatchBlock {
   param([string]$Line)
 
-  if ($Line -match '^\s*catch\s*\{\s*\}') {
-    $fixed = $Line -replace '^\s*catch\s*\{\s*\}', 'catch { Write-Log "Error: $_" -Level "ERROR"; throw }'
+  $fixed = $EMPTY_CATCH_REGEX.Replace($Line, 'catch { Write-Log "Error: $_" -Level "ERROR"; throw }')
+  if ($fixed -cne $Line) {
     Write-Log "Fixed EmptyCatchBlock: Added error logging" -Level "FIXED"
     return $fixed
   }
@@ -426,7 +490,7 @@ function Repair-PluralNoun {
 function Repair-MandatoryParameterDefault {
   param([string]$Line)
 
-  if ($Line -match '\[Parameter\(.*Mandatory\s*=\s*\$true.*\)\]') {
+  if ($MANDATORY_PARAMETER_REGEX.IsMatch($Line)) {
     # This is complex and may require manual intervention
     Write-Log "MandatoryParameterDefaults detected (manual review required): $($Line.Trim())" -Level "WARNING"
   }
@@ -437,20 +501,8 @@ function Repair-MandatoryParameterDefault {
 function Get-AutoFixFunction {
   param([string]$RuleName)
 
-  $fixMap = [PSCustomObject]@{
-    'PSAvoidUsingWriteHost'                          = 'Repair-WriteHost'
-    'PSAvoidUsingCmdletAliases'                      = 'Repair-CmdletAlias'
-    'PSUseDeclaredVarsMoreThanAssignments'           = 'Repair-UnusedVariable'
-    'PSAvoidUsingPlainTextForPassword'               = 'Repair-PlainTextPassword'
-    'PSAvoidUsingConvertToSecureStringWithPlainText' = 'Repair-ConvertToSecureString'
-    'PSAvoidUsingEmptyCatchBlock'                    = 'Repair-EmptyCatchBlock'
-    'PSUseApprovedVerbs'                             = 'Repair-UnapprovedVerb'
-    'PSUseSingularNouns'                             = 'Repair-PluralNoun'
-    'PSAvoidDefaultValueForMandatoryParameter'       = 'Repair-MandatoryParameterDefault'
-  }
-
-  if ($fixMap.PSObject.Properties.Name -contains $RuleName) {
-    return $fixMap.$RuleName
+  if ($AUTO_FIX_FUNCTIONS.PSObject.Properties.Name -contains $RuleName) {
+    return $AUTO_FIX_FUNCTIONS.$RuleName
   }
 
   return $null
@@ -493,19 +545,47 @@ class PSScriptAnalyzerEngine {
 
   [void] EnsurePSScriptAnalyzer() {
     try {
-      if (-not (Get-Module -ListAvailable -Name PSScriptAnalyzer)) {
+      # Already imported in this session - skip the module path scan and re-import
+      $loadedModule = Get-Module -Name PSScriptAnalyzer
+      if ($loadedModule) {
+        if ($this.VerboseMode) {
+          Write-Host "PSScriptAnalyzer module already loaded: Version $($loadedModule.Version)" -ForegroundColor Green
+        }
+        return
+      }
+
+      # Import directly - resolving a single module by name is far cheaper than enumerating every
+      # installed module with -ListAvailable, and only a failed import needs the install path
+      $imported = $true
+      try {
+        Import-Module PSScriptAnalyzer -ErrorAction Stop
+      }
+      catch {
+        $imported = $false
+      }
+
+      if (-not $imported) {
         if ($this.VerboseMode) {
           Write-Host "PSScriptAnalyzer module not found, attempting to install..." -ForegroundColor Yellow
         }
 
-        Install-Module -Name PSScriptAnalyzer -Force -Scope CurrentUser
+        # Progress bar rendering dominates small module downloads - suppress it for the install
+        # Global scope because Install-Module reads preferences from its module and global scope, not this method
+        $previousProgressPreference = $global:ProgressPreference
+        try {
+          $global:ProgressPreference = 'SilentlyContinue'
+          Install-Module -Name PSScriptAnalyzer -Repository PSGallery -Force -Scope CurrentUser -Confirm:$false
+        }
+        finally {
+          $global:ProgressPreference = $previousProgressPreference
+        }
 
         if ($this.VerboseMode) {
           Write-Host "PSScriptAnalyzer module installed successfully" -ForegroundColor Green
         }
-      }
 
-      Import-Module PSScriptAnalyzer -Force
+        Import-Module PSScriptAnalyzer -Force
+      }
 
       if ($this.VerboseMode) {
         $version = (Get-Module PSScriptAnalyzer).Version
@@ -653,50 +733,55 @@ class PSScriptAnalyzerEngine {
     Write-Log "Applying auto-fixes to file: $(Split-Path $filePath -Leaf)" -Level "INFO"
 
     try {
-      # Read file content
-      $lines = Get-Content -Path $filePath
+      # Read file content in one pass - .NET needs the provider path, not a PowerShell-relative one
+      $resolvedFilePath = (Resolve-Path -LiteralPath $filePath).ProviderPath
+      $fileContent = Read-FileContent -FilePath $resolvedFilePath
+      $lines = $fileContent.Lines
       $originalLines = $lines.Clone()
       $modified = $false
 
       # Group violations by line for efficient processing
       $violationsByLine = [PSCustomObject]@{}
+      $violationLines = [System.Collections.Generic.HashSet[int]]::new()
       foreach ($violation in $violations) {
         $lineNumber = $violation.Line
-        if (-not ($violationsByLine.PSObject.Properties.Name -contains $lineNumber)) {
+        if ($violationLines.Add([int]$lineNumber)) {
           $violationsByLine | Add-Member -NotePropertyName $lineNumber -NotePropertyValue @()
         }
         $violationsByLine.$lineNumber += $violation
       }
 
-      # Apply fixes line by line
-      for ($i = 0; $i -lt $lines.Count; $i++) {
-        $lineNumber = $i + 1
+      # Apply fixes only to lines that carry violations
+      foreach ($lineNumber in ($violationLines | Sort-Object)) {
+        $i = $lineNumber - 1
+        if ($i -lt 0 -or $i -ge $lines.Count) {
+          continue
+        }
+
         $line = $lines[$i]
         $originalLine = $line
 
-        if ($violationsByLine.PSObject.Properties.Name -contains $lineNumber) {
-          foreach ($violation in $violationsByLine.$lineNumber) {
-            $fixFunction = Get-AutoFixFunction -RuleName $violation.RuleName
-            if ($fixFunction) {
-              $fixedLine = & $fixFunction $line
-              if ($fixedLine -ne $line) {
-                $line = $fixedLine
-                $modified = $true
-
-                # Record the fix
-                $fix = [PSCustomObject]@{
-                  FilePath  = $filePath
-                  FileName  = Split-Path $filePath -Leaf
-                  Line      = $lineNumber
-                  RuleName  = $violation.RuleName
-                  Original  = $originalLine.Trim()
-                  Fixed     = $line.Trim()
-                  Timestamp = Get-Date
-                }
-
-                [void]$fixes.Add($fix)
-                Write-Log "FIXED: $(Split-Path $filePath -Leaf):$lineNumber - $($violation.RuleName)" -Level "FIXED"
+        foreach ($violation in $violationsByLine.$lineNumber) {
+          $fixFunction = Get-AutoFixFunction -RuleName $violation.RuleName
+          if ($fixFunction) {
+            $fixedLine = & $fixFunction $line
+            if ($fixedLine -ne $line) {
+              $line = $fixedLine
+              $modified = $true
+
+              # Record the fix
+              $fix = [PSCustomObject]@{
+                FilePath  = $filePath
+                FileName  = Split-Path $filePath -Leaf
+                Line      = $lineNumber
+                RuleName  = $violation.RuleName
+                Original  = $originalLine.Trim()
+                Fixed     = $line.Trim()
+                Timestamp = Get-Date
               }
+
+              [void]$fixes.Add($fix)
+              Write-Log "FIXED: $(Split-Path $filePath -Leaf):$lineNumber - $($violation.RuleName)" -Level "FIXED"
             }
           }
         }
@@ -714,7 +799,7 @@ class PSScriptAnalyzerEngine {
           }
         }
 
-        Set-Content -Path $filePath -Value $lines -Encoding UTF8
+        [System.IO.File]::WriteAllLines($resolvedFilePath, $lines, $fileContent.Encoding)
         Write-Log "Updated file: $(Split-Path $filePath -Leaf)" -Level "SUCCESS"
       }
       elseif ($modified -and $this.Configuration.WhatIf) {
@@ -806,8 +891,8 @@ class PSScriptAnalyzerEngine {
       Write-Host "FIXES APPLIED:" -ForegroundColor Green
       foreach ($fix in $this.FixResults | Sort-Object FileName, Line) {
         Write-Host "   $($fix.FileName):$($fix.Line) - $($fix.RuleName)" -ForegroundColor Green
-        Write-Host "    Before: $($fix.Original)" -ForegroundColor Gray
-        Write-Host "    After:  $($fix.Fixed)" -ForegroundColor Gray
+        # Before/After share a colour - emit them in one host write per fix
+        Write-Host "    Before: $($fix.Original)`n    After:  $($fix.Fixed)" -ForegroundColor Gray
       }
     }
 
@@ -964,15 +1049,19 @@ try {
 
   if ($Verbose) {
     Write-Host "Configuration:" -ForegroundColor Cyan
-    Write-Host "  Target Path: $Path" -ForegroundColor White
-    Write-Host "  Severity: $Severity" -ForegroundColor White
-    Write-Host "  Output Format: $OutputFormat" -ForegroundColor White
-    Write-Host "  Auto Fix: $($AutoFix.IsPresent)" -ForegroundColor White
-    Write-Host "  Backup: $($Backup.IsPresent)" -ForegroundColor White
-    Write-Host "  What If: $($WhatIf.IsPresent)" -ForegroundColor White
-    Write-Host "  Recurse: $($Recurse.IsPresent)" -ForegroundColor White
-    Write-Host "  Excluded Rules: $($configuration.ExcludeRules -join ', ')" -ForegroundColor White
-    Write-Host ""
+    # Build the configuration block once and write it to the host in a single call
+    $configurationLines = @(
+      "  Target Path: $Path"
+      "  Severity: $Severity"
+      "  Output Format: $OutputFormat"
+      "  Auto Fix: $($AutoFix.IsPresent)"
+      "  Backup: $($Backup.IsPresent)"
+      "  What If: $($WhatIf.IsPresent)"
+      "  Recurse: $($Recurse.IsPresent)"
+      "  Excluded Rules: $($configuration.ExcludeRules -join ', ')"
+      ""
+    )
+    Write-Host ($configurationLines -join "`n") -ForegroundColor White
   }
 
   # Create and execute analysis engine
@@ -1022,6 +1111,9 @@ catch {
     UtilityVersion = $UTILITY_VERSION
   }
 }
+finally {
+  Close-Logging
+}
 
 Write-Host ""
 Write-Host "PSScriptAnalyzer Utility Service - Operation Complete" -ForegroundColor Magenta
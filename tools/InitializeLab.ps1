@@ -102,7 +102,7 @@ foreach ($configFile in $ConfigFiles) {
     $configPath = Join-Path $ConfigRoot $configFile
     if (Test-Path $configPath) {
         try {
-            $null = Get-Content $configPath | ConvertFrom-Json
+            $null = Get-Content $configPath -Raw | ConvertFrom-Json
             Write-Host "SUCCESS: $configFile - Valid JSON"
         }
         catch {
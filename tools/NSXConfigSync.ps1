@@ -937,28 +937,21 @@ function Get-ConsolidatedResourceType {
 
     $resourceTypes = @()
 
-    # Determine parameter prefixes based on operation type
-    $prefixes = switch ($OperationType) {
-        "Sync" { @("Sync") }
-        "Export" { @("Include") }
-        "Import" { @("Import") }
-        default { @("Sync") }
+    # Determine parameter prefix based on operation type
+    $prefix = switch ($OperationType) {
+        "Sync" { "Sync" }
+        "Export" { "Include" }
+        "Import" { "Import" }
+        default { "Sync" }
     }
 
-    # Check each resource type across all prefixes
+    # Check each resource type against the operation prefix
     $resourceTypeNames = @("Groups", "Services", "SecurityPolicies", "ContextProfiles")
 
     foreach ($resourceType in $resourceTypeNames) {
-        $isIncluded = $false
-        foreach ($prefix in $prefixes) {
-            $paramName = "$prefix$resourceType"
-            # Replace hash table indexing with PSCustomObject property access
-            if ((Get-Member -InputObject $ParameterFlags -Name $paramName -MemberType NoteProperty -ErrorAction SilentlyContinue) -and $ParameterFlags.$paramName -eq $true) {
-                $isIncluded = $true
-                break
-            }
-        }
-        if ($isIncluded) {
+        $paramName = "$prefix$resourceType"
+        # Replace hash table indexing with PSCustomObject property access
+        if ((Get-Member -InputObject $ParameterFlags -Name $paramName -MemberType NoteProperty -ErrorAction SilentlyContinue) -and $ParameterFlags.$paramName -eq $true) {
             $resourceTypes += $resourceType
         }
     }
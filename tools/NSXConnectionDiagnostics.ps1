@@ -189,13 +189,13 @@ function Test-NetworkConnectivity {
   }
 
   # Basic TCP connectivity test (port 443)
+  $tcpClient = New-Object System.Net.Sockets.TcpClient
   try {
-    $tcpClient = New-Object System.Net.Sockets.TcpClient
-    $tcpClient.ConnectAsync($NSXManager, 443).Wait(5000)
-    if ($tcpClient.Connected) {
+    # Wait() returns as soon as the connect completes - only an unreachable host uses the full 5s deadline
+    $connected = $tcpClient.ConnectAsync($NSXManager, 443).Wait(5000)
+    if ($connected -and $tcpClient.Connected) {
       Write-DiagnosticOutput "TCP Connectivity: Port 443 accessible" "SUCCESS"
       $script:DiagnosticResults.TestResults["TCP443"] = "Success"
-      $tcpClient.Close()
     }
     else {
       Write-DiagnosticOutput "TCP Connectivity: Port 443 not accessible" "ERROR"
@@ -208,6 +208,10 @@ function Test-NetworkConnectivity {
     $script:DiagnosticResults.TestResults["TCP443"] = "Error: $($_.Exception.Message)"
     return $false
   }
+  finally {
+    # Close on every path so a connect still pending past the deadline is abandoned, not leaked
+    $tcpClient.Close()
+  }
 
   # HTTPS endpoint test (without authentication)
   try {
@@ -566,9 +570,9 @@ function Start-ComprehensiveDiagnostic {
     }
   }
 
-  # Determine overall status
-  $criticalFailures = ($script:DiagnosticResults.TestResults.Values | Where-Object { $_ -like "*Failed*" -or $_ -like "*Error*" }).Count
-  $warnings = ($script:DiagnosticResults.TestResults.Values | Where-Object { $_ -like "*Warning*" -or $_ -like "*Unavailable*" }).Count
+  # Determine overall status - one alternation scan per result instead of a -like per keyword
+  $criticalFailures = ($script:DiagnosticResults.TestResults.Values | Where-Object { $_ -match 'Failed|Error' }).Count
+  $warnings = ($script:DiagnosticResults.TestResults.Values | Where-Object { $_ -match 'Warning|Unavailable' }).Count
 
   if ($criticalFailures -eq 0) {
     if ($warnings -eq 0) {
@@ -602,10 +606,10 @@ function Show-DiagnosticSummary {
   Write-DiagnosticOutput " TEST RESULTS:" "INFO"
   foreach ($test in $script:DiagnosticResults.TestResults.Keys) {
     $result = $script:DiagnosticResults.TestResults[$test]
-    $resultColor = if ($result -like "*Success*" -or $result -like "*Available*" -or $result -like "*Valid*") {
+    $resultColor = if ($result -match 'Success|Available|Valid') {
       "Green"
     }
-    elseif ($result -like "*Warning*" -or $result -like "*Unavailable*") {
+    elseif ($result -match 'Warning|Unavailable') {
       "Yellow"
     }
     else {
@@ -615,7 +615,7 @@ function Get-EndpointCache {
     }
 
     if (Test-Path $cacheFile) {
-      $cacheData = Get-Content $cacheFile -Raw | ConvertFrom-Json
+      $cacheData = [SharedToolUtilityService]::ReadJsonFileCached($cacheFile)
       $expiresAt = [DateTime]::Parse($cacheData.metadata.expiresAt)
       $isValid = (Get-Date) -lt $expiresAt
       $ttlHours = if ($isValid) { ($expiresAt - (Get-Date)).TotalHours } else { 0 }
@@ -1762,7 +1762,7 @@ else {
 
     if (Test-Path $cacheFile) {
       try {
-        $cacheData = Get-Content $cacheFile -Raw | ConvertFrom-Json
+        $cacheData = [SharedToolUtilityService]::ReadJsonFileCached($cacheFile)
         $cacheExpiry = [DateTime]::Parse($cacheData.metadata.expiresAt)
         $currentTime = Get-Date
 
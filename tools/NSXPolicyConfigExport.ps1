@@ -451,7 +451,8 @@ try {
 
                 foreach ($jsonFile in $jsonFiles) {
                     try {
-                        $content = Get-Content -Path $jsonFile.FullName -Raw
+                        # Syntax-only check - read in one call, skipping provider overhead
+                        $content = [System.IO.File]::ReadAllText($jsonFile.FullName)
                         $null = ConvertFrom-Json -InputObject $content
                         $validJsonCount++
                     }
@@ -495,7 +496,8 @@ try {
 
                 foreach ($jsonFile in $jsonFiles) {
                     try {
-                        $content = Get-Content -Path $jsonFile.FullName -Raw
+                        # Syntax-only check - read in one call, skipping provider overhead
+                        $content = [System.IO.File]::ReadAllText($jsonFile.FullName)
                         $null = ConvertFrom-Json -InputObject $content
                         $validJsonCount++
                     }